@@ -1,13 +1,50 @@
 # -*- coding: utf-8 -*-
+import functools
+import io
+import locale
+import mmap
+import os
+import re
+from enum import Enum, auto
 from pathlib import Path
-from typing import TextIO
+from typing import Any, BinaryIO, Callable
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 __all__ = ["CurveData", "GraphData", "read_grd"]
 
 
+class _Section(Enum):
+    PREAMBLE = auto()  # the lines before the first `#START` one
+    COMMENT = auto()
+    AXIS_DESCRIPTION = auto()
+    BODY = auto()  # the `#START` lines outside of the blocks above
+
+
+# the attributes of `GraphData` set by the lines before the first `#START` one
+_FIRST_LINE_KEYS: dict[str, str] = {
+    " Sample name ": "sample_name",
+    " Date        ": "date",
+    " Specific inf": "specific_info",
+    " User info   ": "user_info",
+}
+
+# the kind of `#START` line is the name of the group that matched last
+_START_LINE: re.Pattern[str] = re.compile(
+    r"#START (?:"
+    r"(?P<comment>comment)"
+    r"|(?P<axes>axis description)"
+    r"|Curve description\s+(?P<curve_number>\d+)"
+    r"|Date:(?P<date>.*)"
+    r"|Time:(?P<time>[^:]*)"
+    r"|Curve Legend [^:]*:(?P<key>.*)"
+    r"|(?P<data>Curve Data)"
+    r"|Curve (?P<points_curve_number>\d+)[^=]*=(?P<points>[^=]*)"
+    r")"
+)
+
+
 class CurveData:
     def __init__(self) -> None:
         self.curve_number: int = 0
@@ -15,12 +52,10 @@ class CurveData:
         self.key: str = ""
         self.duration: float = 0.0
         self.points: int = 0
-        self.data: NDArray[np.float64] = np.empty(0)
+        self.columns: list[NDArray[np.floating]] = []
 
     def __repr__(self) -> str:
-        from os import linesep
-
-        return linesep.join(
+        return os.linesep.join(
             (
                 f"curve number: {self.curve_number}",
                 f"start_date:   {self.start_date}",
@@ -31,13 +66,32 @@ class CurveData:
         )
 
     def __bool__(self) -> bool:
-        return bool(self.data)
+        return len(self) > 0
 
     def __len__(self) -> int:
-        return len(self.data)
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, col: int) -> NDArray[np.floating]:
+        return self.columns[col]
+
+    @property
+    def data(self) -> NDArray[np.floating]:
+        """
+        A read-only copy of the columns stacked into rows
 
-    def __getitem__(self, col: int) -> NDArray[np.float64]:
-        return self.data[..., col]
+        Every access makes a new copy, so prefer `columns` or indexing the curve.
+        To change the data, assign either `data` or `columns`.
+        """
+        data: NDArray[np.floating] = (
+            np.column_stack(self.columns) if self.columns else np.empty(0)
+        )
+        data.flags.writeable = False
+        return data
+
+    @data.setter
+    def data(self, data: NDArray[np.floating]) -> None:
+        # keep every column contiguous in memory, for they are used separately
+        self.columns = list(np.ascontiguousarray(np.atleast_2d(data).T))
 
 
 class GraphData:
@@ -50,17 +104,16 @@ class GraphData:
         self.specific_info: str = ""
         self.user_info: str = ""
         self.comment: list[str] = []
+        self._curve_index: dict[int, int] = {}
 
     def __repr__(self) -> str:
-        from os import linesep
-
-        return linesep.join(
+        return os.linesep.join(
             (
                 f"sample name:   {self.sample_name}",
                 f"date:          {self.date}",
                 f"specific info: {self.specific_info}",
                 f"user info:     {self.user_info}",
-                f"comment:       {linesep.join(self.comment)}",
+                f"comment:       {os.linesep.join(self.comment)}",
                 f"names:         {self.names}",
                 f"units:         {self.units}",
                 "",
@@ -72,17 +125,13 @@ class GraphData:
     def __bool__(self) -> bool:
         return bool(self.curves)
 
-    def __getitem__(self, item: tuple[int, str]) -> NDArray[np.float64]:
+    def __getitem__(self, item: tuple[int, str]) -> NDArray[np.floating]:
         curve_number: int
         channel: str
         curve_number, channel = item
         col: int = self.names.index(channel)
-        index: int = -1
-        for i, c in enumerate(self.curves):
-            if c.curve_number == curve_number:
-                index = i
-                break
-        if index == -1:
+        index: int | None = self._curve_index.get(curve_number)
+        if index is None:
             raise IndexError
         return self.curves[index][col]
 
@@ -95,115 +144,169 @@ class GraphData:
         return self.units[col]
 
 
-def read_grd(fn: Path) -> GraphData:
+_NumbersParser = Callable[[bytes, DTypeLike], NDArray[np.floating] | None]
+
+
+@functools.cache
+def _pandas_read_csv() -> Callable[..., Any] | None:
+    # `pandas` takes long to import, so it's done on the first parsing, not before
+    try:
+        from pandas import read_csv
+    except ImportError:
+        return None
+    return read_csv
+
+
+@functools.cache
+def _numba_parse_numbers() -> _NumbersParser | None:
+    # `numba` takes long to import, so it's done on the first parsing, not before
+    try:
+        from ._numba_parser import parse_numbers
+    except ImportError:
+        return None
+    return parse_numbers
+
+
+def _parse_curve_data(block: bytes, dtype: DTypeLike) -> NDArray[np.floating]:
+    parse_numbers: _NumbersParser | None = _numba_parse_numbers()
+    if parse_numbers is not None:
+        table: NDArray[np.floating] | None = parse_numbers(block, dtype)
+        if table is not None:
+            return table
+    # the decimal separator may be either a comma or a point, even in one file
+    block = block.replace(b",", b".")
+    read_csv: Callable[..., Any] | None = _pandas_read_csv()
+    if read_csv is not None:
+        table = read_csv(
+            io.BytesIO(block),
+            sep=r"\s+",
+            header=None,
+            dtype=dtype,
+            engine="c",
+            float_precision="round_trip",  # the same values as `float` gives
+        ).to_numpy()
+        # `pandas` fails on longer rows but pads shorter ones with NaN silently
+        if table.size != len(block.split()):
+            raise ValueError("the number of columns changed between the rows")
+        return table
+    return np.loadtxt(
+        io.BytesIO(block),
+        dtype=dtype,
+        ndmin=2,
+    )
+
+
+def _read_grd(buf: bytes | mmap.mmap, dtype: DTypeLike) -> GraphData:
     data: GraphData = GraphData()
-    f_in: TextIO
-    with fn.open("rt") as f_in:
-        lines: list[str] = f_in.read().splitlines()
-        first_lines: bool = True
-        reading_comment: bool = False
-        reading_axes_description: int = -1
-        reading_data: bool = False
-        line: str
-        for line in lines:
-            if line.startswith("#START"):
-                first_lines = False
-            elif first_lines:
-                if line.startswith(" Sample name :"):
-                    data.sample_name = line.split(":", maxsplit=1)[-1]
-                elif line.startswith(" Date        :"):
-                    data.date = line.split(":", maxsplit=1)[-1]
-                elif line.startswith(" Specific inf:"):
-                    data.specific_info = line.split(":", maxsplit=1)[-1]
-                elif line.startswith(" User info   :"):
-                    data.user_info = line.split(":", maxsplit=1)[-1]
-            if line.startswith("#START comment"):
-                reading_comment = True
-                continue
-            elif reading_comment:
-                if line.startswith("#END comment"):
-                    reading_comment = False
-                    if data.comment == [" "]:
-                        data.comment.clear()
-                else:
-                    data.comment.append(line.strip())
-                continue
-            if line.startswith("#START axis description"):
-                reading_axes_description = 0
-                continue
-            if reading_axes_description != -1:
-                if line.startswith("#END axis description"):
-                    reading_axes_description = -1
-                    continue
-                if reading_axes_description > 0:
-                    data.names.append(
-                        line.split(maxsplit=10)[-1].strip().replace(" ", "_")
-                    )
-                    data.units.append(
-                        line.split(maxsplit=10)[-2].strip()
-                        if len(line.split()) > 10
-                        else ""
-                    )
-                reading_axes_description += 1
-                continue
-            if line.startswith("#START Curve description"):
-                data.curves.append(CurveData())
-                data.curve.curve_number = int(line.split()[3])
-                reading_data = False
-                continue
-            if line.startswith("#START Date:"):
-                data.curve.start_date = line.split(":", maxsplit=1)[1]
-                continue
-            if line.startswith("#START Time:"):
-                times = line.split(":")[1].split()
-                data.curve.duration = float(times[1].replace(",", ".")) - float(
-                    times[0].replace(",", ".")
-                )
-                continue
-            if line.startswith("#START Curve Legend "):
-                data.curve.key = line.split(":", maxsplit=1)[1]
+    # the same encoding `open` uses for text files by default
+    encoding: str = locale.getpreferredencoding(False)
+    section: _Section = _Section.PREAMBLE
+    axis_line_index: int = 0
+    line_start: int = 0
+    line_end: int
+    line: str
+    while line_start < len(buf):
+        line_end = buf.find(b"\n", line_start)
+        if line_end == -1:
+            line_end = len(buf)
+        line = buf[line_start:line_end].decode(encoding).rstrip("\r")
+        line_start = line_end + 1
+        # every line is handled by the section it belongs to
+        if section is _Section.COMMENT:
+            if line.startswith("#END comment"):
+                section = _Section.BODY
+                if data.comment == [" "]:
+                    data.comment.clear()
+            else:
+                data.comment.append(line.strip())
+            continue
+        if section is _Section.AXIS_DESCRIPTION:
+            if line.startswith("#END axis description"):
+                section = _Section.BODY
+            elif axis_line_index > 0:  # the first line holds the column titles
+                words: list[str] = line.split(maxsplit=10)
+                data.names.append(words[-1].strip().replace(" ", "_"))
+                data.units.append(words[-2].strip() if len(words) > 10 else "")
+            axis_line_index += 1
+            continue
+        if section is _Section.PREAMBLE:
+            if not line.startswith("#START"):
+                key, sep, value = line.partition(":")
+                if sep and key in _FIRST_LINE_KEYS:
+                    setattr(data, _FIRST_LINE_KEYS[key], value)
                 continue
-            if (
-                data
-                and data.curve.curve_number
-                and line.startswith(f"#START Curve {data.curve.curve_number:d}")
-            ):
-                data.curve.points = int(line.split("=")[1])
-                continue
-            if line.startswith("#START Curve Data"):
-                reading_data = True
-                continue
-            elif reading_data:
-                if data.curve.curve_number and line.startswith(
-                    f"#END Curve {data.curve.curve_number:d} -"
-                ):
-                    reading_data = False
-                    continue
-                if data.curve.data.shape[0]:
-                    data.curve.data = np.vstack(
-                        (
-                            data.curve.data,
-                            [float(item.replace(",", ".")) for item in line.split()],
-                        )
-                    )
-                else:
-                    data.curve.data = np.fromiter(
-                        (float(item.replace(",", ".")) for item in line.split()),
-                        dtype=np.float64,
-                    )
-                continue
-        # end for line ...
-    # end with open ...
+            section = _Section.BODY
+
+        match: re.Match[str] | None = _START_LINE.match(line)
+        if match is None:
+            continue
+        kind: str | None = match.lastgroup
+        if kind == "comment":
+            section = _Section.COMMENT
+        elif kind == "axes":
+            section = _Section.AXIS_DESCRIPTION
+            axis_line_index = 0
+        elif kind == "curve_number":
+            data.curves.append(CurveData())
+            data.curve.curve_number = int(match["curve_number"])
+            # the first curve of a number is the one to get by it
+            data._curve_index.setdefault(data.curve.curve_number, len(data.curves) - 1)
+        elif kind == "date":
+            data.curve.start_date = match["date"]
+        elif kind == "time":
+            times = match["time"].split()
+            data.curve.duration = float(times[1].replace(",", ".")) - float(
+                times[0].replace(",", ".")
+            )
+        elif kind == "key":
+            data.curve.key = match["key"]
+        elif (
+            kind == "points"
+            and data
+            and data.curve.curve_number
+            and int(match["points_curve_number"]) == data.curve.curve_number
+        ):
+            data.curve.points = int(match["points"])
+        elif kind == "data":
+            # the data lasts until the next line that starts with "#",
+            # so they are sliced out at once, without splitting into lines
+            data_end: int = buf.find(b"\n#", line_end)
+            if data_end == -1:
+                data_end = len(buf)
+            block: bytes = buf[line_start:data_end]
+            if block.strip():
+                data.curve.data = _parse_curve_data(block, dtype)
+            line_start = data_end + 1
+    # end while line_start ...
     return data
 
 
+def read_grd(fn: Path, dtype: DTypeLike = np.float64) -> GraphData:
+    f_in: BinaryIO
+    with fn.open("rb") as f_in:
+        if not os.fstat(f_in.fileno()).st_size:  # an empty file can't be mapped
+            return GraphData()
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # let the system read the file ahead while the parsing goes on
+            if hasattr(mmap, "MADV_WILLNEED"):  # not on Windows
+                buf.madvise(mmap.MADV_WILLNEED)
+            return _read_grd(buf, dtype)
+
+
 if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
         sys.stderr.write(f"\033[1m\0usage:\033[0m {sys.argv[0]} file1 ...")
 
-    for f in sys.argv[1:]:
-        print(f"PROPERTIES OF {f}:")
-        print(read_grd(Path(f)))
+    from concurrent.futures import ProcessPoolExecutor
+
+    files: list[str] = sys.argv[1:]
+    # the files are independent, so they are read and parsed in parallel
+    with ProcessPoolExecutor() as executor:
+        f: str
+        data: GraphData
+        for f, data in zip(files, executor.map(read_grd, map(Path, files))):
+            print(f"PROPERTIES OF {f}:")
+            print(data)
     print("done")
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from numba import njit  # type: ignore
+from numpy.typing import DTypeLike, NDArray
+
+__all__ = ["parse_numbers"]
+
+# the powers of ten that are exact in `float64`
+_POWERS_OF_TEN: NDArray[np.float64] = 10.0 ** np.arange(23)
+# the largest integer mantissa that `float64` holds exactly
+_MAX_EXACT_MANTISSA: int = 1 << 53
+
+_NEW_LINE: int = ord("\n")
+
+
+@njit(cache=True)
+def _is_space(c: int) -> bool:
+    return c == 32 or c == 9 or c == 10 or c == 13  # " ", "\t", "\n", "\r"
+
+
+@njit(cache=True)
+def _table_shape(buf: NDArray[np.uint8]) -> tuple[int, int]:
+    """Count the lines and the words in a line, or return (-1, -1) if it varies"""
+    rows: int = 0
+    columns: int = -1
+    words: int = 0
+    in_word: bool = False
+    for c in buf:
+        if c == _NEW_LINE:
+            if words:
+                if columns == -1:
+                    columns = words
+                elif columns != words:
+                    return -1, -1
+                rows += 1
+            words = 0
+            in_word = False
+        elif _is_space(c):
+            in_word = False
+        elif not in_word:
+            in_word = True
+            words += 1
+    if words:
+        if columns == -1:
+            columns = words
+        elif columns != words:
+            return -1, -1
+        rows += 1
+    return rows, columns
+
+
+@njit(cache=True)
+def _parse_table(buf: NDArray[np.uint8], out: NDArray[np.float64]) -> bool:
+    """
+    Fill the columns of `out` with the numbers from `buf`, line by line
+
+    The decimal separator is either a point or a comma.
+    Only the numbers that Clinger's fast path converts exactly are taken,
+    i.e., ones with a mantissa below 2⁵³ and a decimal exponent within ±22.
+    For anything else, return `False`, and let a full parser deal with that.
+    """
+    size: int = buf.size
+    index: int = 0
+    i: int = 0
+    while i < size:
+        c = buf[i]
+        if _is_space(c):
+            i += 1
+            continue
+
+        negative: bool = False
+        if c == 45 or c == 43:  # "-" or "+"
+            negative = c == 45
+            i += 1
+        mantissa: int = 0
+        exponent: int = 0
+        has_digits: bool = False
+        while i < size and 48 <= buf[i] <= 57:  # "0"..."9"
+            if mantissa >= _MAX_EXACT_MANTISSA:
+                return False
+            mantissa = mantissa * 10 + (buf[i] - 48)
+            has_digits = True
+            i += 1
+        if i < size and (buf[i] == 46 or buf[i] == 44):  # "." or ","
+            i += 1
+            while i < size and 48 <= buf[i] <= 57:
+                if mantissa >= _MAX_EXACT_MANTISSA:
+                    return False
+                mantissa = mantissa * 10 + (buf[i] - 48)
+                exponent -= 1
+                has_digits = True
+                i += 1
+        if not has_digits:
+            return False
+        if i < size and (buf[i] == 101 or buf[i] == 69):  # "e" or "E"
+            i += 1
+            exponent_negative: bool = False
+            if i < size and (buf[i] == 45 or buf[i] == 43):
+                exponent_negative = buf[i] == 45
+                i += 1
+            explicit_exponent: int = 0
+            has_digits = False
+            while i < size and 48 <= buf[i] <= 57:
+                if explicit_exponent > 1000:
+                    return False
+                explicit_exponent = explicit_exponent * 10 + (buf[i] - 48)
+                has_digits = True
+                i += 1
+            if not has_digits:
+                return False
+            if exponent_negative:
+                exponent -= explicit_exponent
+            else:
+                exponent += explicit_exponent
+        if i < size and not _is_space(buf[i]):
+            return False
+        if mantissa > _MAX_EXACT_MANTISSA or not -22 <= exponent <= 22:
+            if mantissa:
+                return False
+            exponent = 0
+
+        if index >= out.size:
+            return False
+        value: float
+        if exponent >= 0:
+            value = float(mantissa) * _POWERS_OF_TEN[exponent]
+        else:
+            value = float(mantissa) / _POWERS_OF_TEN[-exponent]
+        out[index % out.shape[0], index // out.shape[0]] = -value if negative else value
+        index += 1
+    return index == out.size
+
+
+def parse_numbers(block: bytes, dtype: DTypeLike) -> NDArray[np.floating] | None:
+    """
+    Parse a table of numbers, one row a line, in compiled code
+
+    Return `None` if the table is not regular or contains numbers
+    the fast path can't convert exactly.
+    """
+    buf: NDArray[np.uint8] = np.frombuffer(block, dtype=np.uint8)
+    rows: int
+    columns: int
+    rows, columns = _table_shape(buf)
+    if rows <= 0:
+        return None
+    columns_data: NDArray[np.float64] = np.empty((columns, rows), dtype=np.float64)
+    if not _parse_table(buf, columns_data):
+        return None
+    # the rows are put column-wise, so the columns remain contiguous
+    return columns_data.astype(dtype, copy=False).T
@@ -3,6 +3,7 @@ import math
 from pathlib import Path
 from typing import Literal, cast
 
+import numpy as np
 import pyqtgraph as pg  # type: ignore
 from pyqtgraph.functions import siScale
 from qtpy.QtCore import QByteArray, QPoint, QPointF, QRect, QRectF, QSettings
@@ -32,6 +33,9 @@ class Cursor:
         )
         self.si_prefix: bool = True
         self.decimals: int = 3
+        self._last_point: QPointF = QPointF(math.nan, math.nan)
+        self._last_view_rect: QRectF = QRectF()
+        self._last_units: tuple[str, str] = ("", "")
 
     def show(self, do_show: bool = True) -> None:
         self._crosshair_h_line.setVisible(do_show)
@@ -45,17 +49,33 @@ class Cursor:
         axes: dict[str, dict[Literal["item", "pos"], pg.AxisItem | tuple[int, int]]] = (
             self._parent.axes
         )
+        sx: float
+        sy: float
+        sx, sy = self._parent.vb.viewPixelSize()
+        view_rect: QRectF = self._parent.vb.viewRect()
+        units: tuple[str, str] = (
+            axes["bottom"]["item"].labelUnits,
+            axes["left"]["item"].labelUnits,
+        )
+        # nothing would change on the screen if the cursor stays within a pixel,
+        # unless the view has been panned or zoomed, or the units have changed
+        if (
+            abs(point.x() - self._last_point.x()) < sx
+            and abs(point.y() - self._last_point.y()) < sy
+            and view_rect == self._last_view_rect
+            and units == self._last_units
+        ):
+            return
+        self._last_point = QPointF(point)
+        self._last_view_rect = view_rect
+        self._last_units = units
+
         self._crosshair_v_line.setPos(point.x())
         self._crosshair_h_line.setPos(point.y())
         self._cursor_balloon.setHtml(
-            self.format(point.x(), axes["bottom"]["item"].labelUnits)
-            + "<br>"
-            + self.format(point.y(), axes["left"]["item"].labelUnits)
+            self.format(point.x(), units[0]) + "<br>" + self.format(point.y(), units[1])
         )
         balloon_border: QRectF = self._cursor_balloon.boundingRect()
-        sx: float
-        sy: float
-        sx, sy = self._parent.vb.viewPixelSize()
         balloon_width: float = balloon_border.width() * sx
         balloon_height: float = balloon_border.height() * sy
         anchor_x: float = self._cursor_balloon.anchor.x()
@@ -87,8 +107,8 @@ class Cursor:
             parts.update({"si_prefix": p, "scaled_value": s * val})
         else:
             # no SI prefix /unit requested; scale is 1
-            exp: int = int(math.floor(math.log10(abs(val)))) if val != 0.0 else 0
-            man: float = val * math.pow(0.1, exp)
+            exp: int = math.floor(math.log10(abs(val))) if val != 0.0 else 0
+            man: float = val * 10.0**-exp
             parts.update(
                 {"si_prefix": "", "scaled_value": val, "exp": exp, "mantissa": man}
             )
@@ -174,12 +194,31 @@ class Plot(QMainWindow):
         else:
             self._canvas.setTitle(grd_data.date)
 
+        # don't recalculate the view range after every curve added
+        view_box: pg.ViewBox = self._canvas.vb
+        view_box.disableAutoRange()
         index: int
         curve: CurveData
+        items: list[pg.PlotDataItem] = []
         for index, curve in enumerate(grd_data.curves):
-            self._canvas.plot(
-                curve[0], curve[1], name=curve.key or None, pen=pg.mkColor(index)
+            items.append(
+                pg.PlotDataItem(
+                    curve[0], curve[1], name=curve.key or None, pen=pg.mkColor(index)
+                )
             )
+            self._canvas.addItem(items[-1])  # this resets the downsampling of it
+        view_box.autoRange()
+        view_box.enableAutoRange()
+
+        # draw no more points than there are pixels on the screen;
+        # both the options presume that the x-values go in increasing order;
+        # they are set only now, for the clipping of the curves to the view
+        # would have spoilt the fitting of the view to them
+        item: pg.PlotDataItem
+        for item, curve in zip(items, grd_data.curves):
+            if np.all(np.diff(curve[0]) >= 0.0):
+                item.setDownsampling(auto=True, method="peak")
+                item.setClipToView(True)
 
         self._canvas.setLabel("bottom", grd_data.names[0], grd_data.units[0])
         self._canvas.setLabel("left", grd_data.names[1], grd_data.units[1])
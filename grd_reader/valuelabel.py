@@ -101,8 +101,8 @@ class ValueLabel(QLabel):
             parts.update({"si_prefix": p, "scaledValue": s * val})
         else:
             # no SI prefix /unit requested; scale is 1
-            exp: int = int(math.floor(math.log10(abs(val)))) if val != 0.0 else 0
-            man: float = val * math.pow(0.1, exp)
+            exp: int = math.floor(math.log10(abs(val))) if val != 0.0 else 0
+            man: float = val * 10.0**-exp
             parts.update(
                 {"si_prefix": "", "scaledValue": val, "exp": exp, "mantissa": man}
             )
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+import grd_reader
+
+
+@pytest.mark.parametrize(
+    "block",
+    [b"1.5 2.5\n3.5 4.5\n", b"1,5 2,5\n3,5 4,5\n", b"1,5 2.5\n3.5 4,5"],
+)
+def test_pandas_takes_both_decimal_separators(
+    monkeypatch: pytest.MonkeyPatch, block: bytes
+) -> None:
+    pytest.importorskip("pandas")
+    monkeypatch.setattr(grd_reader, "_numba_parse_numbers", lambda: None)
+    np.testing.assert_array_equal(
+        grd_reader._parse_curve_data(block, np.float64), [[1.5, 2.5], [3.5, 4.5]]
+    )
+
+
+def test_numbers_beyond_the_fast_path() -> None:
+    # 17 significant digits and a large exponent make `parse_numbers` give up
+    np.testing.assert_array_equal(
+        grd_reader._parse_curve_data(
+            b"0.10000000000000001 1e-30\n2,5 3.5\n", np.float64
+        ),
+        [[0.10000000000000001, 1e-30], [2.5, 3.5]],
+    )
+
+
+@pytest.mark.parametrize("read_csv", [True, False], ids=["pandas", "numpy"])
+def test_ragged_rows_are_rejected(
+    monkeypatch: pytest.MonkeyPatch, read_csv: bool
+) -> None:
+    if read_csv:
+        pytest.importorskip("pandas")
+    else:
+        monkeypatch.setattr(grd_reader, "_pandas_read_csv", lambda: None)
+    monkeypatch.setattr(grd_reader, "_numba_parse_numbers", lambda: None)
+    with pytest.raises(ValueError):
+        grd_reader._parse_curve_data(b"1 2\n3", np.float64)
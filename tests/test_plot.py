@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import os
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("pyqtgraph")
+QtWidgets = pytest.importorskip("qtpy.QtWidgets")
+
+from grd_reader.plot import Plot  # noqa: E402
+
+
+def test_view_fits_curves_away_from_origin(tmp_path: Path) -> None:
+    lines: list[str] = [
+        "#START axis description",
+        "Nr  a b c d e f g h  Name",
+        "1 a b c d e f g h  s Time",
+        "2 a b c d e f g h  V Voltage",
+        "#END axis description",
+    ]
+    curve_number: int
+    for curve_number in (1, 2):
+        lines.extend(
+            (
+                f"#START Curve description {curve_number}",
+                f"#START Curve {curve_number} points = 101",
+                "#START Curve Data",
+                *(f"{x},0 {x * curve_number},5" for x in range(100, 201)),
+                f"#END Curve {curve_number} - ",
+            )
+        )
+    filename: Path = tmp_path / "curves.grd"
+    filename.write_text("\n".join(lines) + "\n")
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    plot: Plot = Plot()
+    plot.plot(filename)
+    app.processEvents()
+    (x_min, x_max), (y_min, y_max) = plot._canvas.vb.viewRange()
+    assert x_min <= 100.0 and x_max >= 200.0
+    assert y_min <= 100.5 and y_max >= 400.5
+    # the curves are monotonic, so they are still drawn clipped and downsampled
+    assert all(
+        item.opts["clipToView"] and item.opts["autoDownsample"]
+        for item in plot._canvas.listDataItems()
+    )
+
+
+def test_cursor_follows_view_and_units_at_the_same_point() -> None:
+    from qtpy.QtCore import QPointF
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    plot: Plot = Plot()
+    plot.resize(640, 480)
+    plot.show()
+    view_box = plot._canvas.vb
+    view_box.setRange(xRange=(0.0, 10.0), yRange=(0.0, 10.0), padding=0.0)
+    plot._canvas.setLabel("bottom", "Time", "s")
+    app.processEvents()
+    cursor = plot._plot_cursor
+    point: QPointF = QPointF(0.01, 5.0)
+    cursor.move(point)
+    assert cursor._cursor_balloon.anchor.x() == 0.0
+    assert "s" in cursor._cursor_balloon.textItem.toPlainText()
+
+    # the point is now at the right edge, so the balloon must go to its left
+    view_box.setRange(xRange=(-9.99, 0.02), padding=0.0)
+    app.processEvents()
+    cursor.move(point)
+    assert cursor._cursor_balloon.anchor.x() == 1.0
+
+    plot._canvas.setLabel("bottom", "Time", "Hz")
+    cursor.move(point)
+    assert "Hz" in cursor._cursor_balloon.textItem.toPlainText()
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import grd_reader
+
+
+def test_repeated_curve_number_gives_the_first_curve() -> None:
+    data: grd_reader.GraphData = grd_reader._read_grd(
+        b"#START axis description\n"
+        b"titles\n"
+        b"0 0 0 0 0 0 0 0 0 s time\n"
+        b"0 0 0 0 0 0 0 0 0 V voltage\n"
+        b"#END axis description\n"
+        b"#START Curve description 1\n"
+        b"#START Curve Data\n"
+        b"1 2\n"
+        b"#START Curve description 1\n"
+        b"#START Curve Data\n"
+        b"3 4\n",
+        np.float64,
+    )
+    assert len(data.curves) == 2
+    np.testing.assert_array_equal(data[1, "voltage"], [2.0])